@@ -11,12 +11,90 @@ pdfjsLib.GlobalWorkerOptions.workerSrc = 'https://cdnjs.cloudflare.com/ajax/libs
 const CROSSREF_API = 'https://api.crossref.org/works';
 const MAILTO = 'ghostref@example.com';
 
-// DOI regex patterns - comprehensive
-const DOI_PATTERNS = [
-    /\b(10\.\d{4,}\/[^\s\]\)>,;'"]+)/gi,                    // Standard DOI
-    /doi[:\s]+([^\s\]\)>,;'"]+)/gi,                          // doi: prefix
-    /https?:\/\/(?:dx\.)?doi\.org\/([^\s\]\)>,;'"]+)/gi,    // URL format
-];
+// CrossRef date fields to take a work's year from, best first
+const YEAR_DATE_FIELDS = ['published', 'issued', 'created'];
+
+// Max DOIs per CrossRef filter query (keeps the request URL a sane length;
+// a chunk that still gets HTTP 414 is split in half)
+const DOI_BATCH_SIZE = 40;
+
+// DOI prefixes registered with other agencies (DataCite etc.) - CrossRef
+// always 404s on these, so they go straight to the doi.org check
+const NON_CROSSREF_PREFIXES = new Set([
+    '10.5281',  // Zenodo
+    '10.6084',  // figshare
+    '10.48550', // arXiv
+    '10.5061',  // Dryad
+    '10.1594',  // PANGAEA
+    '10.15468'  // GBIF
+]);
+
+// Verified lookups are cached in localStorage so repeat uploads skip CrossRef
+const CACHE_PREFIX = 'ghostref:';
+const CACHE_TTL_MS = 30 * 24 * 60 * 60 * 1000; // 30 days
+// DOIs that neither CrossRef nor doi.org know are remembered for less time
+// (they may just not be registered yet)
+const NOT_FOUND_TTL_MS = 24 * 60 * 60 * 1000; // 1 day
+
+// CrossRef responses worth retrying (rate limited or transient server errors)
+const RETRY_STATUSES = [429, 500, 502, 503, 504];
+const MAX_RETRIES = 3;
+
+// How many recently extracted PDFs to keep references for (re-runs skip parsing)
+const MAX_CACHED_PDFS = 5;
+
+// A DOI whose CrossRef title shares fewer of its words (%) with the citation
+// it came from is flagged as a likely wrong or made-up reference
+const TITLE_MATCH_THRESHOLD = 50;
+
+// Max requests in flight at once, CrossRef and doi.org combined - DOI and
+// citation lookups run side by side but share these slots (see limitedFetch).
+// Kept low to stay polite to CrossRef.
+const MAX_CONCURRENT_REQUESTS = 4;
+
+// DOI regex - a bare 10.xxxx/ DOI also matches inside the "doi:" prefix and
+// doi.org URL forms, so a single pattern (and a single scan) covers all three
+const DOI_PATTERN = /\b(10\.\d{4,}\/[^\s\]\)>,;'"]+)/;
+
+// Document-wide DOI scan - every 10.xxxx/yyyy in the text. No /i flag: the
+// pattern has no letters to fold.
+const DOI_SCAN_PATTERN = /\b(10\.\d{4,9}\/[^\s\]\)>,;'"]{3,})/g;
+
+// References section boundaries - one alternation each, so finding a
+// boundary is a single scan rather than one scan per heading
+const REFS_START_PATTERN = /\n\s*(?:References?|Bibliography|Works?\s+Cited|Literature\s+Cited|Cited\s+References?)\s*\n/i;
+const NUMBERED_REFS_START_PATTERN = /\n\s*1\.\s+[A-Z][a-z]+/;
+const REFS_END_PATTERN = /\n\s*(?:Appendix|Further\s+reading|Supplementary|Acknowledgment|Author\s+contributions|Data\s+availability|Conflict\s+of\s+interest|Extended\s+Data)/i;
+
+// Reference-number anchors: "[12]" anywhere, or "12. Capital" at the start of a line
+const REF_NUMBER_PATTERN = /\[(\d+)\]|(?:^|\n)\s*(\d{1,3})\.\s+(?=[A-Z])/g;
+
+// Unnumbered citation styles, tried in order after the numbered styles.
+// (?=([^(]{10,200}))\1 is the JS spelling of a possessive [^(]{10,200}+ - giving
+// characters back can never expose a "(", so the engine shouldn't try.
+const ET_AL_CITATION_PATTERN = /[A-Z][a-z]+(?:,?\s+[A-Z]\.?(?:\s*[A-Z]\.?)*|\s+et\s+al\.)(?=([^(]{10,200}))\1\(\d{4}\)/g;
+const AUTHOR_YEAR_CITATION_PATTERN = /[A-Z][a-z]+,?\s+[A-Z]\.?[^.]*\(\d{4}\)[^.]*\./g;
+
+// Citation sanity checks (see looksLikeCitation)
+const YEAR_PATTERN = /\b(19|20)\d{2}\b/;
+const AUTHOR_HINT_PATTERN = /[A-Z]\.|[A-Z][a-z]+,/;
+const NON_CITATION_PATTERN = /^(Theorem|Lemma|Proof|Definition|Appendix|Figure|Table)\b/i;
+const WHITESPACE_RUN = /\s+/g;
+const COMBINING_MARKS = /[\u0300-\u036f]/g;
+
+// Title word matching - words are runs of letters/digits, minus filler
+// words that would match almost any citation
+const WORD_SEPARATORS = /[^\p{L}\p{N}]+/u;
+// CrossRef titles can carry JATS/HTML/MathML markup (<i>, <scp>, <mml:math ...>)
+const MARKUP_TAG = /<[^>]+>/g;
+const STOP_WORDS = new Set([
+    'the', 'and', 'for', 'with', 'from', 'into', 'onto', 'over', 'via',
+    'its', 'are', 'was', 'were', 'has', 'have', 'not', 'but', 'that',
+    'this', 'these', 'those', 'their', 'our', 'than', 'between', 'through'
+]);
+
+// Punctuation the DOI regexes can pick up at the end of a match
+const DOI_TRAILING_CHARS = '.,;:)]}>\'"';
 
 // DOM Elements
 const dropZone = document.getElementById('drop-zone');
@@ -42,6 +120,20 @@ const filterBtns = document.querySelectorAll('.filter-btn');
 let selectedFile = null;
 let currentResults = null;
 let currentFilter = 'all';
+const lookupCache = new Map(); // in-memory layer over localStorage
+const referencesCache = new Map(); // file identity -> { dois, citations }
+let cachePrunedAfterWriteError = false; // see setCached
+
+// CrossRef rate limit token bucket - starts at the polite-pool default and is
+// resized from the X-Rate-Limit-* response headers
+let rateLimitPerInterval = 50;
+let rateLimitIntervalMs = 1000;
+let rateTokens = rateLimitPerInterval;
+let rateTokensUpdatedAt = Date.now();
+
+// Shared request slots (see limitedFetch)
+let requestsInFlight = 0;
+const requestSlotWaiters = [];
 
 // Initialize
 function init() {
@@ -49,6 +141,7 @@ function init() {
     setupFileInput();
     setupButtons();
     setupFilters();
+    pruneCache();
 }
 
 // Drag and Drop
@@ -150,47 +243,52 @@ async function startVerification() {
     showProgress();
     
     try {
-        // Step 1: Extract text from PDF
-        updateProgress('Extracting text from PDF...', 10);
-        const text = await extractTextFromPDF(selectedFile);
-        
-        if (!text.trim()) {
-            throw new Error('Could not extract text from PDF. It may be a scanned image.');
-        }
+        // Steps 1-3: Extract text, DOIs and citations from the PDF
+        const { dois, citations } = await getReferences(selectedFile);
+        console.log('Found DOIs:', dois.length);
+        console.log('Found citations:', citations.length);
         
-        let allResults = [];
+        // Skip citations whose DOI is already covered by the document-wide DOI check
+        const scannedDOIs = new Set(dois);
+        const unverifiedCitations = citations.filter(c => !c.doi || !scannedDOIs.has(c.doi));
         
-        // Step 2: Extract ALL DOIs from entire document
-        updateProgress('Scanning for DOIs...', 20);
-        const dois = extractAllDOIs(text);
-        console.log('Found DOIs:', dois.length);
+        // Step 4: Verify DOIs and citations at the same time - both go through
+        // crossrefFetch, so they share one rate limiter
+        const total = dois.length + unverifiedCitations.length;
+        // Results are tallied as they arrive, so problems show up before the end
+        let verified = 0;
+        let notFound = 0;
+        const onVerified = (result) => {
+            verified++;
+            if (result.valid === false) notFound++;
+            const progress = 30 + (65 * (verified / total));
+            updateProgress(`Verified ${verified}/${total} references` + (notFound > 0 ? ` (${notFound} not found)...` : '...'), progress);
+        };
         
-        if (dois.length > 0) {
-            updateProgress(`Verifying ${dois.length} DOIs...`, 30);
-            const doiResults = await verifyDOIs(dois);
-            allResults = allResults.concat(doiResults);
-        }
+        updateProgress(`Verifying ${dois.length} DOIs and ${unverifiedCitations.length} citations...`, 30);
+        const [doiResults, citResults] = await Promise.all([
+            verifyDOIs(dois, onVerified),
+            verifyCitations(unverifiedCitations, onVerified)
+        ]);
         
-        // Step 3: Also parse citations (for refs without DOIs)
-        updateProgress('Parsing citations...', 50);
-        const refsSection = findReferencesSection(text);
-        const citations = parseCitations(refsSection);
-        console.log('Found citations:', citations.length);
+        // Renumber citations to continue from DOI results
+        citResults.forEach((r, i) => r.index = doiResults.length + i + 1);
+        const allResults = doiResults.concat(citResults);
         
-        if (citations.length > 0) {
-            // Filter out citations that we already verified via DOI
-            const verifiedDOIs = new Set(allResults.filter(r => r.valid).map(r => r.doi?.toLowerCase()));
-            const unverifiedCitations = citations.filter(c => {
-                const citDOI = extractDOI(c.raw);
-                return !citDOI || !verifiedDOIs.has(citDOI.toLowerCase());
-            });
-            
-            if (unverifiedCitations.length > 0) {
-                updateProgress(`Verifying ${unverifiedCitations.length} citations by title...`, 60);
-                const citResults = await verifyCitations(unverifiedCitations);
-                // Renumber to continue from DOI results
-                citResults.forEach((r, i) => r.index = allResults.length + i + 1);
-                allResults = allResults.concat(citResults);
+        // A real DOI pasted onto the wrong reference is a classic hallucination -
+        // score the title CrossRef returned against the citation the DOI came from
+        const citationTexts = new Map();
+        for (const citation of citations) {
+            if (citation.doi) citationTexts.set(citation.doi, citation.raw);
+        }
+        for (const result of allResults) {
+            const citationText = result.method === 'crossref' && citationTexts.get(result.doi.toLowerCase());
+            // No title on record (or none with scorable words) means nothing
+            // to compare, not a mismatch
+            if (!citationText || result.title === 'Unknown') continue;
+            const score = titleMatch(result.title, citationText);
+            if (score !== null) {
+                result.similarity = Math.round(score * 100);
             }
         }
         
@@ -198,7 +296,7 @@ async function startVerification() {
             throw new Error('Could not find any DOIs or parseable citations in this PDF.');
         }
         
-        // Step 4: Show results
+        // Step 5: Show results
         currentResults = allResults;
         showResults();
         
@@ -208,65 +306,105 @@ async function startVerification() {
     }
 }
 
-// PDF Text Extraction
+// DOIs and citations of a PDF
+// Re-running the same file (retry, re-upload) reuses them instead of parsing
+// the PDF and its reference list again. Keyed by name/size/mtime - an edited
+// file has a new mtime.
+async function getReferences(file) {
+    const key = `${file.name}:${file.size}:${file.lastModified}`;
+    if (referencesCache.has(key)) {
+        return referencesCache.get(key);
+    }
+    
+    // Step 1: Extract text from PDF
+    updateProgress('Extracting text from PDF...', 10);
+    const text = await extractTextFromPDF(file);
+    
+    if (!text.trim()) {
+        throw new Error('Could not extract text from PDF. It may be a scanned image.');
+    }
+    
+    // Step 2: Extract ALL DOIs from entire document
+    updateProgress('Scanning for DOIs...', 20);
+    const dois = extractAllDOIs(text);
+    
+    // Step 3: Also parse citations (for refs without DOIs)
+    updateProgress('Parsing citations...', 25);
+    const refsSection = findReferencesSection(text);
+    const citations = parseCitations(refsSection);
+    
+    // Find each citation's DOI once - reused by verifyCitations. Lowercased
+    // like the scanned DOIs (DOIs are case-insensitive), so they compare directly.
+    for (const citation of citations) {
+        citation.doi = extractDOI(citation.raw)?.toLowerCase();
+    }
+    
+    const references = { dois, citations };
+    referencesCache.set(key, references);
+    if (referencesCache.size > MAX_CACHED_PDFS) {
+        // Maps iterate in insertion order - drop the oldest
+        referencesCache.delete(referencesCache.keys().next().value);
+    }
+    return references;
+}
+
 async function extractTextFromPDF(file) {
     const arrayBuffer = await file.arrayBuffer();
-    const pdf = await pdfjsLib.getDocument({ data: arrayBuffer }).promise;
-    
-    let fullText = '';
-    const numPages = pdf.numPages;
+    let pdf = null;
     
-    for (let i = 1; i <= numPages; i++) {
-        const page = await pdf.getPage(i);
-        const textContent = await page.getTextContent();
-        const pageText = textContent.items.map(item => item.str).join(' ');
-        fullText += pageText + '\n';
+    try {
+        pdf = await pdfjsLib.getDocument({ data: arrayBuffer }).promise;
+        const numPages = pdf.numPages;
+        let pagesDone = 0;
         
-        const extractProgress = 10 + (10 * (i / numPages));
-        updateProgress(`Extracting page ${i}/${numPages}...`, extractProgress);
+        // Request every page at once - the worker pipelines them instead of
+        // waiting on a round-trip per page. Promise.all keeps page order.
+        const pageTexts = await Promise.all(
+            Array.from({ length: numPages }, async (_, i) => {
+                const page = await pdf.getPage(i + 1);
+                const textContent = await page.getTextContent();
+                // We only need the text - drop the page's parsed resources right away
+                page.cleanup();
+                
+                pagesDone++;
+                const extractProgress = 10 + (10 * (pagesDone / numPages));
+                updateProgress(`Extracting page ${pagesDone}/${numPages}...`, extractProgress);
+                
+                return textContent.items.map(item => item.str).join(' ');
+            })
+        );
+        
+        return pageTexts.join('\n') + '\n';
+    } finally {
+        // Free the worker-side document (fonts, xref, object caches)
+        pdf?.destroy();
     }
-    
-    return fullText;
 }
 
 // Find References Section
 function findReferencesSection(text) {
-    const startPatterns = [
-        /\n\s*References?\s*\n/i,
-        /\n\s*Bibliography\s*\n/i,
-        /\n\s*REFERENCES?\s*\n/i,
-        /\n\s*Works?\s+Cited\s*\n/i,
-        /\n\s*Literature\s+Cited\s*\n/i,
-        /\n\s*Cited\s+References?\s*\n/i,
-    ];
-    
-    // Patterns that indicate END of references section
-    const endPatterns = [
-        /\n\s*Appendix/i,
-        /\n\s*APPENDIX/i,
-        /\n\s*Further\s+reading/i,
-        /\n\s*Supplementary/i,
-        /\n\s*Acknowledgment/i,
-        /\n\s*Author\s+contributions/i,
-        /\n\s*Data\s+availability/i,
-        /\n\s*Conflict\s+of\s+interest/i,
-        /\n\s*Extended\s+Data/i,
-    ];
-    
+    // References sit at the back of the paper, so look for the header one page
+    // at a time from the end and stop at the first page that has one
+    // (extractTextFromPDF ends every page with a newline)
     let refsStart = -1;
-    for (const pattern of startPatterns) {
-        const match = text.search(pattern);
+    let pageEnd = text.length;
+    while (refsStart === -1 && pageEnd > 0) {
+        const prevNewline = pageEnd >= 2 ? text.lastIndexOf('\n', pageEnd - 2) : -1;
+        // Start at the previous page's newline - the header patterns anchor on it
+        const pageStart = Math.max(prevNewline, 0);
+        const match = text.substring(pageStart, pageEnd).search(REFS_START_PATTERN);
+        
         if (match !== -1) {
-            refsStart = match;
-            console.log('Found references section at position:', match);
-            break;
+            refsStart = pageStart + match;
+            console.log('Found references section at position:', refsStart);
         }
+        pageEnd = prevNewline + 1;
     }
     
     // If no header found, look for numbered refs pattern starting somewhere
     if (refsStart === -1) {
         // Look for first occurrence of "1. Author" pattern (start of numbered refs)
-        const numberedStart = text.search(/\n\s*1\.\s+[A-Z][a-z]+/);
+        const numberedStart = text.search(NUMBERED_REFS_START_PATTERN);
         if (numberedStart !== -1 && numberedStart > text.length * 0.5) {
             // Only use if it's in the back half of the document
             refsStart = numberedStart;
@@ -282,14 +420,11 @@ function findReferencesSection(text) {
     // Get text from references start
     let refsText = text.substring(refsStart);
     
-    // Try to find where references END
-    for (const pattern of endPatterns) {
-        const endMatch = refsText.substring(100).search(pattern);
-        if (endMatch !== -1) {
-            console.log('Found end of references at:', endMatch + 100);
-            refsText = refsText.substring(0, endMatch + 100);
-            break;
-        }
+    // Try to find where references END (earliest end heading wins)
+    const endMatch = refsText.substring(100).search(REFS_END_PATTERN);
+    if (endMatch !== -1) {
+        console.log('Found end of references at:', endMatch + 100);
+        refsText = refsText.substring(0, endMatch + 100);
     }
     
     return refsText;
@@ -297,89 +432,92 @@ function findReferencesSection(text) {
 
 // Parse individual citations from references section
 function parseCitations(text) {
-    const citations = [];
-    
     // Try different citation patterns
     
-    // Pattern 1: Numbered citations [1], [2], etc.
-    const bracketMatches = text.match(/\[\d+\][^\[]+/g);
-    if (bracketMatches && bracketMatches.length > 2) {
-        console.log('Using bracketed number pattern, found:', bracketMatches.length);
-        for (let i = 0; i < bracketMatches.length; i++) {
-            const raw = bracketMatches[i];
-            const numMatch = raw.match(/\[(\d+)\]/);
-            const index = numMatch ? parseInt(numMatch[1]) : i + 1;
-            const citationText = raw.replace(/\[\d+\]\s*/, '').trim();
-            const citation = cleanCitation(citationText);
-            if (citation && looksLikeCitation(citation)) {
-                citations.push({ raw: citation, index: index });
-            }
-        }
-        if (citations.length > 0) return citations;
-    }
-    
-    // Pattern 2: Numbered with dot: 1. 2. 3. or 123. (handles multi-digit)
-    // Match: newline/start, optional space, 1-3 digit number, dot, space, capital letter, then text
-    const dotMatches = text.match(/(?:^|\n)\s*(\d{1,3})\.\s+[A-Z][^\n]+(?:\n(?!\s*\d{1,3}\.)[^\n]+)*/gm);
-    if (dotMatches && dotMatches.length > 2) {
-        console.log('Using dot number pattern, found:', dotMatches.length);
-        for (let i = 0; i < dotMatches.length; i++) {
-            const raw = dotMatches[i];
-            const numMatch = raw.match(/(\d{1,3})\./);
-            const index = numMatch ? parseInt(numMatch[1]) : i + 1;
-            const citationText = raw.replace(/^\s*\d{1,3}\.\s*/, '').trim();
-            const citation = cleanCitation(citationText);
-            if (citation && looksLikeCitation(citation)) {
-                citations.push({ raw: citation, index: index });
-            }
-        }
-        if (citations.length > 0) return citations;
-    }
+    // Patterns 1-2: Numbered citations [1], [2], ... or 1. 2. 3. (handles multi-digit)
+    let citations = parseNumberedCitations(text);
+    if (citations.length > 0) return citations;
     
     // Pattern 3: Nature/Science style - "Author et al. Title. Journal Volume, Pages (Year)."
     // Look for "et al." or author initials followed by text and year in parens
-    const etAlMatches = text.match(/[A-Z][a-z]+(?:,?\s+[A-Z]\.?(?:\s*[A-Z]\.?)*|\s+et\s+al\.)[^(]{10,200}\(\d{4}\)/g);
-    if (etAlMatches && etAlMatches.length > 2) {
-        console.log('Using et al. pattern, found:', etAlMatches.length);
-        for (let i = 0; i < etAlMatches.length; i++) {
-            const citation = cleanCitation(etAlMatches[i]);
+    citations = collectCitations(text, ET_AL_CITATION_PATTERN, 'et al.');
+    if (citations.length > 0) return citations;
+    
+    // Pattern 4: Author-year style - look for author names followed by year
+    citations = collectCitations(text, AUTHOR_YEAR_CITATION_PATTERN, 'author-year');
+    if (citations.length > 0) return citations;
+    
+    console.log('No citation pattern matched well');
+    return citations;
+}
+
+// Split numbered references in a single pass: collect every reference-number
+// anchor, then take the text between consecutive anchors of the same style.
+// [n] style wins over "n." style when both are present.
+function parseNumberedCitations(text) {
+    const bracketAnchors = [];
+    const dotAnchors = [];
+    
+    for (const match of text.matchAll(REF_NUMBER_PATTERN)) {
+        const anchor = {
+            number: parseInt(match[1] ?? match[2]),
+            start: match.index,
+            end: match.index + match[0].length
+        };
+        (match[1] !== undefined ? bracketAnchors : dotAnchors).push(anchor);
+    }
+    
+    for (const [label, anchors] of [['bracketed number', bracketAnchors], ['dot number', dotAnchors]]) {
+        if (anchors.length <= 2) continue;
+        console.log(`Using ${label} pattern, found:`, anchors.length);
+        
+        const citations = [];
+        for (let i = 0; i < anchors.length; i++) {
+            const end = i + 1 < anchors.length ? anchors[i + 1].start : text.length;
+            const citation = cleanCitation(text.substring(anchors[i].end, end));
             if (citation && looksLikeCitation(citation)) {
-                citations.push({ raw: citation, index: i + 1 });
+                citations.push({ raw: citation, index: anchors[i].number });
             }
         }
         if (citations.length > 0) return citations;
     }
     
-    // Pattern 4: Author-year style - look for author names followed by year
-    const authorYearMatches = text.match(/[A-Z][a-z]+,?\s+[A-Z]\.?[^.]*\(\d{4}\)[^.]*\./g);
-    if (authorYearMatches && authorYearMatches.length > 2) {
-        console.log('Using author-year pattern, found:', authorYearMatches.length);
-        for (let i = 0; i < authorYearMatches.length; i++) {
-            const citation = cleanCitation(authorYearMatches[i]);
-            if (citation && looksLikeCitation(citation)) {
-                citations.push({ raw: citation, index: i + 1 });
-            }
+    return [];
+}
+
+// Build citations straight from the match objects of a global pattern,
+// numbered in match order. A pattern matching 2 or fewer times is treated as
+// not being the document's citation style.
+function collectCitations(text, pattern, label) {
+    const citations = [];
+    let matchCount = 0;
+    
+    for (const match of text.matchAll(pattern)) {
+        matchCount++;
+        const citation = cleanCitation(match[0]);
+        if (citation && looksLikeCitation(citation)) {
+            citations.push({ raw: citation, index: matchCount });
         }
-        if (citations.length > 0) return citations;
     }
     
-    console.log('No citation pattern matched well');
+    if (matchCount <= 2) return [];
+    console.log(`Using ${label} pattern, found:`, matchCount);
     return citations;
 }
 
 // Check if text looks like a real citation (has author-like names and year)
 function looksLikeCitation(text) {
+    // Must be reasonable length (cheapest check first)
+    if (text.length < 30 || text.length > 1000) return false;
+    
     // Must have something that looks like a year
-    if (!/\b(19|20)\d{2}\b/.test(text)) return false;
+    if (!YEAR_PATTERN.test(text)) return false;
     
     // Must have something that looks like author names (Initial. or Name,)
-    if (!/[A-Z]\.|[A-Z][a-z]+,/.test(text)) return false;
-    
-    // Must be reasonable length
-    if (text.length < 30 || text.length > 1000) return false;
+    if (!AUTHOR_HINT_PATTERN.test(text)) return false;
     
     // Should not be just a header or equation
-    if (/^(Theorem|Lemma|Proof|Definition|Appendix|Figure|Table)\b/i.test(text)) return false;
+    if (NON_CITATION_PATTERN.test(text)) return false;
     
     return true;
 }
@@ -387,7 +525,7 @@ function looksLikeCitation(text) {
 function cleanCitation(text) {
     if (!text) return null;
     // Clean up whitespace, limit length
-    let cleaned = text.replace(/\s+/g, ' ').trim();
+    let cleaned = text.replace(WHITESPACE_RUN, ' ').trim();
     // Take first ~500 chars (one citation shouldn't be longer)
     if (cleaned.length > 500) {
         cleaned = cleaned.substring(0, 500);
@@ -395,174 +533,157 @@ function cleanCitation(text) {
     return cleaned.length > 10 ? cleaned : null;
 }
 
-// Extract likely title from citation text
-function extractTitle(citationText) {
-    // Clean up the text first
-    let text = citationText.replace(/\s+/g, ' ').trim();
-    
-    // Pattern 1: Text in quotes "Title here" or ''Title here''
-    let match = text.match(/["'']([^"'']{10,200})["'']/);
-    if (match) return match[1].trim();
-    
-    // Pattern 2: After "et al." - very common: "Author et al. Title here."
-    match = text.match(/et\s+al\.\s+([A-Z][^.]{10,150})/);
-    if (match) return match[1].trim();
-    
-    // Pattern 3: After author block ending with initial+period, then title starts with caps
-    // Match: "Name, A., Name, B. & Name, C. Title starts here"
-    // The key is finding where authors end (last initial with period) and title begins
-    match = text.match(/(?:[A-Z]\.\s*(?:&\s*)?)+([A-Z][a-z][a-z]+\s+[a-z]+[^.]{10,120})/);
-    if (match) return match[1].trim();
-    
-    // Pattern 4: Split by periods, find first sentence that's NOT authors
-    const parts = text.split(/\.\s+/);
-    for (let i = 0; i < parts.length; i++) {
-        const part = parts[i].trim();
-        // Skip author-looking parts (contain initials like "A." or "& Name")
-        if (/[A-Z]\.,|&\s*[A-Z]/.test(part)) continue;
-        // Skip journal/volume parts
-        if (/^\d|^[A-Z][a-z]+\.\s*[A-Z]|^Nat\.|^Sci\.|^Phys\./.test(part)) continue;
-        // Skip too short
-        if (part.length < 15) continue;
-        // This looks like a title
-        if (/^[A-Z]/.test(part)) {
-            return part;
-        }
-    }
-    
-    // Pattern 5: After (Year). Title here. (APA style)
-    match = text.match(/\(\d{4}\)\.\s*([A-Z][^.]{10,150})/);
-    if (match) return match[1].trim();
-    
-    // Last resort: skip first 30 chars (likely authors), take next chunk
-    if (text.length > 50) {
-        const chunk = text.substring(30, 150);
-        const titleStart = chunk.search(/[A-Z][a-z]+\s+[a-z]/);
-        if (titleStart !== -1) {
-            return chunk.substring(titleStart, titleStart + 80).split(/\.\s/)[0];
+// Extract DOI from citation text
+function extractDOI(text) {
+    const match = DOI_PATTERN.exec(text);
+    if (match) {
+        const doi = trimDOI(match[1]);
+        // Validate basic DOI format
+        if (doi.length > 7) {
+            return doi;
         }
     }
-    
     return null;
 }
 
-// Extract DOI from citation text
-function extractDOI(text) {
-    for (const pattern of DOI_PATTERNS) {
-        pattern.lastIndex = 0; // Reset regex state
-        const match = pattern.exec(text);
-        if (match) {
-            let doi = match[1];
-            // Clean trailing punctuation
-            doi = doi.replace(/[.,;:\)\]}>'"]+$/, '');
-            // Validate basic DOI format
-            if (doi.startsWith('10.') && doi.length > 7) {
-                return doi;
-            }
-        }
+// Strip trailing punctuation from a matched DOI - walks back from the end
+// instead of running an end-anchored regex over every match
+function trimDOI(doi) {
+    let end = doi.length;
+    while (end > 0 && DOI_TRAILING_CHARS.includes(doi[end - 1])) {
+        end--;
     }
-    return null;
+    return doi.substring(0, end);
 }
 
 // Extract ALL DOIs from entire document (format-agnostic)
 function extractAllDOIs(text) {
     const doiSet = new Set();
     
-    // Comprehensive DOI pattern - find all 10.xxxx/yyyy patterns
-    const masterPattern = /\b(10\.\d{4,9}\/[^\s\]\)>,;'"]{3,})/gi;
-    
-    let match;
-    while ((match = masterPattern.exec(text)) !== null) {
-        let doi = match[1];
-        // Clean trailing punctuation
-        doi = doi.replace(/[.,;:\)\]}>'"]+$/, '');
-        // Validate
-        if (doi.length > 10 && doi.length < 100) {
-            doiSet.add(doi);
-        }
-    }
-    
-    // Also check for doi.org URLs
-    const urlPattern = /doi\.org\/(10\.\d{4,9}\/[^\s\]\)>,;'"]{3,})/gi;
-    while ((match = urlPattern.exec(text)) !== null) {
-        let doi = match[1].replace(/[.,;:\)\]}>'"]+$/, '');
+    // Also catches DOIs inside doi.org URLs and after "doi:" prefixes
+    for (const match of text.matchAll(DOI_SCAN_PATTERN)) {
+        const doi = trimDOI(match[1]);
+        // Validate - DOIs are case-insensitive, so keep one lowercase copy of each
         if (doi.length > 10 && doi.length < 100) {
-            doiSet.add(doi);
+            doiSet.add(doi.toLowerCase());
         }
     }
     
     return Array.from(doiSet);
 }
 
-// Verify multiple DOIs against CrossRef
-async function verifyDOIs(dois) {
-    const results = [];
-    const total = dois.length;
+// Verify multiple DOIs against CrossRef, passing each result to onVerified as it arrives
+// DOIs are expected lowercased, as extractAllDOIs returns them
+async function verifyDOIs(dois, onVerified) {
+    const chunks = [];
+    for (let start = 0; start < dois.length; start += DOI_BATCH_SIZE) {
+        chunks.push(dois.slice(start, start + DOI_BATCH_SIZE));
+    }
     
-    for (let i = 0; i < dois.length; i++) {
-        const doi = dois[i];
-        progressDetail.textContent = `Verifying: ${doi}`;
+    // One filter query per chunk, a few chunks in flight at once
+    const found = new Map();
+    const notInCrossref = new Set();
+    await mapConcurrent(chunks, MAX_CONCURRENT_REQUESTS, async (chunk) => {
+        const uncached = chunk.filter(doi => !getCachedDOI(doi) && !isNonCrossrefDOI(doi));
+        if (uncached.length === 0) return;
         
-        const result = await verifyDOI(doi);
-        results.push({
-            index: i + 1,
-            raw: doi,
-            doi: doi,
-            ...result
-        });
+        progressDetail.textContent = `Verifying: ${uncached[0]}` + (uncached.length > 1 ? ` (+${uncached.length - 1} more)` : '');
+        const batch = await verifyDOIsBatch(uncached);
+        if (!batch) return;
+        
+        for (const doi of uncached) {
+            if (batch.has(doi)) {
+                found.set(doi, batch.get(doi));
+            } else {
+                notInCrossref.add(doi);
+            }
+        }
+    });
+    
+    // The rest are checked one by one - concurrently, so a run of misses costs
+    // about one round-trip. A DOI the batch answered for but didn't return is
+    // already known to be missing from CrossRef, so only doi.org is asked;
+    // a DOI whose batch request failed gets the full lookup.
+    const verified = await mapConcurrent(dois, MAX_CONCURRENT_REQUESTS, async (doi) => {
+        const result = getCachedDOI(doi) || found.get(doi) ||
+            await (notInCrossref.has(doi) ? verifyDoiOrg(doi) : verifyDOI(doi));
+        onVerified(result);
+        return result;
+    });
+    
+    return dois.map((doi, i) => ({
+        index: i + 1,
+        raw: doi,
+        doi: doi,
+        ...verified[i]
+    }));
+}
+
+// Verify a batch of DOIs with a single CrossRef filter query
+// Returns a Map of lowercased DOI -> result for the DOIs CrossRef knows about,
+// or null if the request itself failed
+async function verifyDOIsBatch(dois) {
+    try {
+        const filter = dois.map(doi => `doi:${doi}`).join(',');
+        const url = `${CROSSREF_API}?filter=${encodeURIComponent(filter)}&rows=${dois.length}`;
+        const response = await crossrefFetch(url);
+        
+        if (response.status === 414 && dois.length > 1) {
+            // URI too long - verify each half separately. If either half fails
+            // the batch as a whole has no answer for its DOIs; the good half's
+            // works are already cached, so the per-DOI fallback still reuses them.
+            const mid = Math.ceil(dois.length / 2);
+            const first = await verifyDOIsBatch(dois.slice(0, mid));
+            const second = await verifyDOIsBatch(dois.slice(mid));
+            return first && second ? new Map([...first, ...second]) : null;
+        }
         
-        const progress = 40 + (55 * ((i + 1) / total));
-        updateProgress(`Verified ${i + 1}/${total} DOIs...`, progress);
+        if (!response.ok) {
+            return null;
+        }
         
-        await sleep(150);
+        const data = await response.json();
+        const found = new Map();
+        
+        for (const work of data.message?.items || []) {
+            const result = workResult(work, 'crossref');
+            setCachedDOI(work.DOI, result);
+            found.set(work.DOI.toLowerCase(), result);
+        }
+        
+        return found;
+        
+    } catch {
+        return null;
     }
-    
-    return results;
 }
 
 // Verify single DOI - try CrossRef first, then doi.org as fallback
 async function verifyDOI(doi) {
+    const cached = getCachedDOI(doi);
+    if (cached) return cached;
+    
     try {
+        // Known non-CrossRef registrant - skip the guaranteed 404
+        if (isNonCrossrefDOI(doi)) {
+            return await verifyDoiOrg(doi);
+        }
+        
         // Step 1: Try CrossRef (gives us metadata)
-        const url = `${CROSSREF_API}/${encodeURIComponent(doi)}?mailto=${MAILTO}`;
-        const response = await fetch(url);
+        const url = `${CROSSREF_API}/${encodeURIComponent(doi)}`;
+        const response = await crossrefFetch(url);
         
         if (response.ok) {
             const data = await response.json();
-            const work = data.message;
-            
-            const authors = work.author || [];
-            const authorStr = authors.length > 0 
-                ? authors.slice(0, 3).map(a => a.family || a.name || 'Unknown').join(', ') + (authors.length > 3 ? ' et al.' : '')
-                : 'Unknown';
-            
-            return {
-                valid: true,
-                title: work.title?.[0] || 'Unknown',
-                authors: authorStr,
-                year: String(work.published?.['date-parts']?.[0]?.[0] || work.created?.['date-parts']?.[0]?.[0] || 'Unknown'),
-                doi: work.DOI,
-                journal: work['container-title']?.[0] || work.publisher || 'Unknown',
-                method: 'crossref'
-            };
+            const result = workResult(data.message, 'crossref');
+            setCachedDOI(doi, result);
+            return result;
         }
         
         // Step 2: CrossRef failed (404 or error) - try doi.org to see if DOI exists at all
         // This catches Zenodo, arXiv, DataCite DOIs that aren't in CrossRef
         if (response.status === 404) {
-            const doiOrgValid = await checkDoiOrg(doi);
-            if (doiOrgValid) {
-                return {
-                    valid: true,
-                    title: 'Valid DOI (not indexed by CrossRef)',
-                    authors: 'Unknown',
-                    year: 'Unknown',
-                    doi: doi,
-                    journal: 'DataCite/Zenodo/Other',
-                    method: 'doi.org'
-                };
-            }
-            return { valid: false, error: 'DOI not found in CrossRef or doi.org' };
+            return await verifyDoiOrg(doi);
         }
         
         return { valid: null, error: `HTTP ${response.status}` };
@@ -572,32 +693,261 @@ async function verifyDOI(doi) {
     }
 }
 
+// Check a DOI that CrossRef doesn't know about against doi.org
+async function verifyDoiOrg(doi) {
+    const doiOrgValid = await checkDoiOrg(doi);
+    if (doiOrgValid) {
+        const result = {
+            valid: true,
+            title: 'Valid DOI (not indexed by CrossRef)',
+            authors: 'Unknown',
+            year: 'Unknown',
+            doi: doi,
+            journal: 'DataCite/Zenodo/Other',
+            method: 'doi.org'
+        };
+        setCachedDOI(doi, result);
+        return result;
+    }
+    
+    // No answer from doi.org is an error, not evidence the DOI is made up
+    if (doiOrgValid === null) {
+        return { valid: null, error: 'Could not check DOI with doi.org' };
+    }
+    
+    const result = { valid: false, error: 'DOI not found in CrossRef or doi.org' };
+    setCachedDOI(doi, result, NOT_FOUND_TTL_MS);
+    return result;
+}
+
+function isNonCrossrefDOI(doi) {
+    return NON_CROSSREF_PREFIXES.has(doi.slice(0, doi.indexOf('/')));
+}
+
+// Year of a CrossRef work from the first date field that has one
+function workYear(work) {
+    for (const field of YEAR_DATE_FIELDS) {
+        const year = work[field]?.['date-parts']?.[0]?.[0];
+        if (year) return String(year);
+    }
+    return 'Unknown';
+}
+
+// Build a verified result from a CrossRef work record, copying out only the
+// handful of fields we display (the full record can be tens of KB)
+function workResult(work, method) {
+    const authors = work.author || [];
+    const authorStr = authors.length > 0 
+        ? authors.slice(0, 3).map(a => a.family || a.name || 'Unknown').join(', ') + (authors.length > 3 ? ' et al.' : '')
+        : 'Unknown';
+    
+    return {
+        valid: true,
+        title: work.title?.[0] || 'Unknown',
+        authors: authorStr,
+        year: workYear(work),
+        doi: work.DOI,
+        journal: work['container-title']?.[0] || work.publisher || 'Unknown',
+        method: method
+    };
+}
+
+// Lookup result cache - verified results, plus DOIs doi.org definitely
+// doesn't know (for NOT_FOUND_TTL_MS). Network errors are never stored.
+// Keys are namespaced by lookup type: "doi:<doi>", "biblio:<citation text>".
+function getCached(key) {
+    if (lookupCache.has(key)) return lookupCache.get(key);
+    
+    try {
+        const entry = JSON.parse(localStorage.getItem(CACHE_PREFIX + key));
+        if (entry && Date.now() - entry.time < (entry.ttl || CACHE_TTL_MS)) {
+            lookupCache.set(key, entry.result);
+            return entry.result;
+        }
+        if (entry) localStorage.removeItem(CACHE_PREFIX + key);
+    } catch {
+        // Storage disabled or corrupt entry - treat as a miss
+    }
+    return null;
+}
+
+function setCached(key, result, ttl = CACHE_TTL_MS) {
+    lookupCache.set(key, result);
+    
+    const entry = JSON.stringify({ time: Date.now(), ttl, result });
+    try {
+        localStorage.setItem(CACHE_PREFIX + key, entry);
+    } catch {
+        // Storage full (or disabled) - make room from expired entries and try
+        // once more; failing that, the in-memory copy still helps this session.
+        // Only once per session: if the store is full of live entries, pruning
+        // frees nothing and would rescan all of localStorage on every write.
+        if (cachePrunedAfterWriteError) return;
+        cachePrunedAfterWriteError = true;
+        pruneCache();
+        try {
+            localStorage.setItem(CACHE_PREFIX + key, entry);
+        } catch {
+            // Give up on persisting this one
+        }
+    }
+}
+
+// Remove expired lookups from localStorage. Entries are otherwise only
+// dropped when read again, so ones that never come up again would pile up
+// toward the storage quota.
+function pruneCache() {
+    try {
+        const keys = [];
+        for (let i = 0; i < localStorage.length; i++) {
+            const key = localStorage.key(i);
+            if (key?.startsWith(CACHE_PREFIX)) keys.push(key);
+        }
+        
+        const now = Date.now();
+        for (const key of keys) {
+            let entry = null;
+            try {
+                entry = JSON.parse(localStorage.getItem(key));
+            } catch {
+                // Corrupt entry - removed below
+            }
+            if (!entry || now - entry.time >= (entry.ttl || CACHE_TTL_MS)) {
+                localStorage.removeItem(key);
+            }
+        }
+    } catch {
+        // Storage disabled - nothing to prune
+    }
+}
+
+function getCachedDOI(doi) {
+    return getCached(`doi:${doi.trim().toLowerCase()}`);
+}
+
+function setCachedDOI(doi, result, ttl) {
+    setCached(`doi:${doi.trim().toLowerCase()}`, result, ttl);
+}
+
+// Fetch from CrossRef - adds the polite-pool mailto and retries with
+// exponential backoff on rate limiting, server errors and network failures
+async function crossrefFetch(url) {
+    const separator = url.includes('?') ? '&' : '?';
+    const fullUrl = `${url}${separator}mailto=${MAILTO}`;
+    
+    for (let attempt = 0; ; attempt++) {
+        try {
+            await acquireRateToken();
+            const response = await limitedFetch(fullUrl);
+            updateRateLimit(response);
+            if (!RETRY_STATUSES.includes(response.status) || attempt >= MAX_RETRIES) {
+                return response;
+            }
+        } catch (error) {
+            if (attempt >= MAX_RETRIES) throw error;
+        }
+        await sleep(500 * 2 ** attempt);
+    }
+}
+
+// fetch() that waits for one of the MAX_CONCURRENT_REQUESTS shared slots, so
+// the DOI and citation lookup pools together never exceed the limit
+async function limitedFetch(url, options) {
+    if (requestsInFlight < MAX_CONCURRENT_REQUESTS) {
+        requestsInFlight++;
+    } else {
+        // releaseRequestSlot hands its slot straight to us
+        await new Promise(resolve => requestSlotWaiters.push(resolve));
+    }
+    
+    try {
+        return await fetch(url, options);
+    } finally {
+        releaseRequestSlot();
+    }
+}
+
+function releaseRequestSlot() {
+    const next = requestSlotWaiters.shift();
+    if (next) {
+        next();
+    } else {
+        requestsInFlight--;
+    }
+}
+
+// Wait until the bucket has a token for one CrossRef request
+async function acquireRateToken() {
+    for (;;) {
+        const now = Date.now();
+        const refill = (now - rateTokensUpdatedAt) * rateLimitPerInterval / rateLimitIntervalMs;
+        rateTokens = Math.min(rateLimitPerInterval, rateTokens + refill);
+        rateTokensUpdatedAt = now;
+        
+        if (rateTokens >= 1) {
+            rateTokens -= 1;
+            return;
+        }
+        await sleep((1 - rateTokens) * rateLimitIntervalMs / rateLimitPerInterval);
+    }
+}
+
+// Resize the bucket from CrossRef's advertised limit (e.g. "50" per "1s").
+// The headers are only visible if CrossRef exposes them to CORS requests;
+// otherwise the default stays in place.
+function updateRateLimit(response) {
+    const limit = parseInt(response.headers?.get('X-Rate-Limit-Limit'));
+    const intervalSeconds = parseInt(response.headers?.get('X-Rate-Limit-Interval'));
+    if (limit > 0 && intervalSeconds > 0) {
+        rateLimitPerInterval = limit;
+        rateLimitIntervalMs = intervalSeconds * 1000;
+    }
+}
+
 // Check if DOI exists via doi.org (works for all registrars: CrossRef, DataCite, etc.)
+// Resolves to null when doi.org gives no definite answer
 async function checkDoiOrg(doi) {
+    const url = `https://doi.org/api/handles/${doi}`;
     try {
-        const response = await fetch(`https://doi.org/api/handles/${doi}`);
+        // Existence only - a HEAD answers 200/404 without the JSON body
+        const head = await limitedFetch(url, { method: 'HEAD' });
+        if (head.status === 200 || head.status === 404) {
+            return head.ok;
+        }
+    } catch {
+        // HEAD failed outright (network, or blocked by CORS) - try the GET below
+    }
+    
+    try {
+        // HEAD not supported or inconclusive - fall back to reading the body
+        const response = await limitedFetch(url);
         if (response.ok) {
             const data = await response.json();
             return data.responseCode === 1; // 1 = success/found
         }
-        return false;
+        return response.status === 404 ? false : null;
     } catch {
-        return false;
+        return null;
     }
 }
 
-// Extract bibliographic info for fallback search
 // Search CrossRef using raw citation text - let CrossRef do the parsing
 async function searchCrossRefRaw(rawCitation, index) {
     try {
         // Clean up the citation text - remove excessive whitespace, limit length
         const cleanedCitation = rawCitation
-            .replace(/\s+/g, ' ')
+            .replace(WHITESPACE_RUN, ' ')
             .trim()
             .substring(0, 300); // CrossRef handles up to ~300 chars well
         
-        const url = `${CROSSREF_API}?query.bibliographic=${encodeURIComponent(cleanedCitation)}&rows=1&mailto=${MAILTO}`;
-        const response = await fetch(url);
+        const cacheKey = `biblio:${cleanedCitation.toLowerCase()}`;
+        const cached = getCached(cacheKey);
+        if (cached) {
+            return { ...cached, index, raw: rawCitation };
+        }
+        
+        const url = `${CROSSREF_API}?query.bibliographic=${encodeURIComponent(cleanedCitation)}&rows=1`;
+        const response = await crossrefFetch(url);
         
         if (!response.ok) {
             return { index, raw: rawCitation, valid: null, error: `HTTP ${response.status}` };
@@ -621,125 +971,24 @@ async function searchCrossRefRaw(rawCitation, index) {
         
         // CrossRef returns a relevance score - use it to gauge confidence
         // Scores vary widely but generally >50 is decent, >100 is good
-        const authors = work.author || [];
-        const authorStr = authors.length > 0 
-            ? authors.slice(0, 3).map(a => a.family || a.name || 'Unknown').join(', ') + (authors.length > 3 ? ' et al.' : '')
-            : 'Unknown';
-        
-        return {
-            index,
-            raw: rawCitation,
-            valid: true,
-            title: work.title?.[0] || 'Unknown',
-            authors: authorStr,
-            year: String(work.published?.['date-parts']?.[0]?.[0] || work.created?.['date-parts']?.[0]?.[0] || 'Unknown'),
-            doi: work.DOI,
-            journal: work['container-title']?.[0] || work.publisher || 'Unknown',
-            method: 'bibliographic',
-            score: score
-        };
+        const result = workResult(work, 'bibliographic');
+        result.score = score;
+        setCached(cacheKey, result);
+        return { ...result, index, raw: rawCitation };
         
     } catch (error) {
         return { index, raw: rawCitation, valid: null, error: error.message || 'Network error' };
     }
 }
 
-function extractBiblio(text) {
-    const biblio = {};
-    
-    // Extract author (first author surname)
-    const authorMatch = text.match(/^([A-Z][a-z]+)/);
-    if (authorMatch) biblio.author = authorMatch[1];
-    
-    // Extract year
-    const yearMatch = text.match(/\((\d{4})\)/);
-    if (yearMatch) biblio.year = yearMatch[1];
-    
-    // Extract journal abbreviation patterns
-    const journalPatterns = [
-        /\b(Nature|Science|Cell|PNAS|PLoS|Phys\.?\s*Rev|J\.?\s*Chem|Nat\.?\s*\w+)\b/i,
-        /\b([A-Z][a-z]+\.?\s+[A-Z][a-z]+\.?)\s+\d+/,  // "J. Chem. Phys. 123"
-    ];
-    for (const pattern of journalPatterns) {
-        const match = text.match(pattern);
-        if (match) {
-            biblio.journal = match[1];
-            break;
-        }
-    }
-    
-    // Extract volume/pages
-    const volMatch = text.match(/\b(\d{1,4}),\s*(\d+)/);
-    if (volMatch) {
-        biblio.volume = volMatch[1];
-        biblio.page = volMatch[2];
-    }
-    
-    return Object.keys(biblio).length >= 2 ? biblio : null;
-}
-
-// Search CrossRef by bibliographic query (fallback)
-async function searchCrossRefBiblio(biblio, rawCitation, index) {
-    try {
-        // Build query string
-        let query = '';
-        if (biblio.author) query += biblio.author + ' ';
-        if (biblio.journal) query += biblio.journal + ' ';
-        if (biblio.year) query += biblio.year + ' ';
-        if (biblio.volume) query += biblio.volume;
-        
-        const url = `${CROSSREF_API}?query.bibliographic=${encodeURIComponent(query.trim())}&rows=1&mailto=${MAILTO}`;
-        const response = await fetch(url);
-        
-        if (!response.ok) {
-            return { index, raw: rawCitation, valid: null, error: `HTTP ${response.status}` };
-        }
-        
-        const data = await response.json();
-        const items = data.message?.items || [];
-        
-        if (items.length === 0) {
-            return { index, raw: rawCitation, searchedBiblio: query, valid: false, error: 'No match found' };
-        }
-        
-        const work = items[0];
-        
-        // Trust CrossRef - they know what they're doing
-        const foundYear = work.published?.['date-parts']?.[0]?.[0] || work.created?.['date-parts']?.[0]?.[0];
-        
-        const authors = work.author || [];
-        const authorStr = authors.length > 0 
-            ? authors.slice(0, 3).map(a => a.family || a.name || 'Unknown').join(', ') + (authors.length > 3 ? ' et al.' : '')
-            : 'Unknown';
-        
-        return {
-            index,
-            raw: rawCitation,
-            valid: true,
-            title: work.title?.[0] || 'Unknown',
-            authors: authorStr,
-            year: String(foundYear || 'Unknown'),
-            doi: work.DOI,
-            journal: work['container-title']?.[0] || work.publisher || 'Unknown',
-            method: 'biblio'
-        };
-        
-    } catch (error) {
-        return { index, raw: rawCitation, valid: null, error: error.message };
-    }
-}
-
-// Verify citations against CrossRef - DOI → Title → Bibliographic
-async function verifyCitations(citations) {
-    const results = [];
-    const total = citations.length;
-    
-    for (let i = 0; i < citations.length; i++) {
-        const citation = citations[i];
+// Verify citations against CrossRef - DOI → Bibliographic
+// Passes each citation's result to onVerified as it arrives
+async function verifyCitations(citations, onVerified) {
+    return mapConcurrent(citations, MAX_CONCURRENT_REQUESTS, async (citation) => {
         let result;
         
         // Method 1: Try DOI first (if present in citation text)
-        const doi = extractDOI(citation.raw);
+        const doi = citation.doi;
         if (doi) {
             progressDetail.textContent = `Verifying DOI: ${doi}`;
             const doiResult = await verifyDOI(doi);
@@ -756,100 +1005,33 @@ async function verifyCitations(citations) {
             result = await searchCrossRefRaw(citation.raw, citation.index);
         }
         
-        results.push(result);
-        
-        // Update progress
-        const progress = 40 + (55 * ((i + 1) / total));
-        updateProgress(`Verified ${i + 1}/${total} citations...`, progress);
-        
-        // Rate limiting
-        await sleep(200);
-    }
-    
-    return results;
+        onVerified(result);
+        return result;
+    });
 }
 
-// Search CrossRef by title
-async function searchCrossRef(title, rawCitation, index) {
-    try {
-        const query = encodeURIComponent(title);
-        const url = `${CROSSREF_API}?query.title=${query}&rows=1&mailto=${MAILTO}`;
-        
-        const response = await fetch(url);
-        
-        if (!response.ok) {
-            return {
-                index,
-                raw: rawCitation,
-                searchedTitle: title,
-                valid: null,
-                error: `HTTP ${response.status}`
-            };
-        }
-        
-        const data = await response.json();
-        const items = data.message?.items || [];
-        
-        if (items.length === 0) {
-            return {
-                index,
-                raw: rawCitation,
-                searchedTitle: title,
-                valid: false,
-                error: 'No matching publication found in CrossRef'
-            };
-        }
-        
-        const work = items[0];
-        const foundTitle = work.title?.[0] || '';
-        
-        // Trust CrossRef - if they returned a result for our query, it's likely correct
-        // Their search is already doing fuzzy matching
-        const similarity = calculateSimilarity(title.toLowerCase(), foundTitle.toLowerCase());
-        
-        // Found a match!
-        const authors = work.author || [];
-        const authorStr = authors.length > 0 
-            ? authors.slice(0, 3).map(a => a.family || a.name || 'Unknown').join(', ') + (authors.length > 3 ? ' et al.' : '')
-            : 'Unknown';
-        
-        const year = work.published?.['date-parts']?.[0]?.[0] || 
-                     work.created?.['date-parts']?.[0]?.[0] || 
-                     'Unknown';
-        
-        return {
-            index,
-            raw: rawCitation,
-            searchedTitle: title,
-            valid: true,
-            title: foundTitle,
-            authors: authorStr,
-            year: String(year),
-            doi: work.DOI,
-            journal: work['container-title']?.[0] || work.publisher || 'Unknown',
-            similarity: Math.round(similarity * 100)
-        };
-        
-    } catch (error) {
-        return {
-            index,
-            raw: rawCitation,
-            searchedTitle: title,
-            valid: null,
-            error: error.message || 'Network error'
-        };
+// Share of a title's words that appear as whole words in a citation's text,
+// or null if the title has no words worth comparing ("Go", "On AI")
+function titleMatch(title, citationText) {
+    const words = titleWords(title);
+    if (words.size === 0) return null;
+    
+    const citationWords = titleWords(citationText);
+    let found = 0;
+    for (const word of words) {
+        if (citationWords.has(word)) found++;
     }
+    return found / words.size;
 }
 
-// Simple string similarity (Jaccard on words)
-function calculateSimilarity(str1, str2) {
-    const words1 = new Set(str1.split(/\s+/).filter(w => w.length > 2));
-    const words2 = new Set(str2.split(/\s+/).filter(w => w.length > 2));
-    
-    const intersection = new Set([...words1].filter(x => words2.has(x)));
-    const union = new Set([...words1, ...words2]);
-    
-    return union.size > 0 ? intersection.size / union.size : 0;
+// Folded word set of a title, without markup, punctuation or filler words
+function titleWords(str) {
+    return new Set(foldText(str.replace(MARKUP_TAG, ' ')).split(WORD_SEPARATORS).filter(w => w.length > 2 && !STOP_WORDS.has(w)));
+}
+
+// Lowercase and strip accents, so "García" and "Garcia" compare equal
+function foldText(str) {
+    return str.toLowerCase().normalize('NFD').replace(COMBINING_MARKS, '');
 }
 
 // UI Updates
@@ -869,9 +1051,14 @@ function showResults() {
     progressSection.classList.add('hidden');
     resultsSection.classList.remove('hidden');
     
-    const valid = currentResults.filter(r => r.valid === true).length;
-    const invalid = currentResults.filter(r => r.valid === false).length;
-    const errors = currentResults.filter(r => r.valid === null).length;
+    // Tally all three outcomes in one pass over the results. A title mismatch
+    // is flagged with the invalid ones - that's the hallucination signal
+    let valid = 0, invalid = 0, errors = 0;
+    for (const r of currentResults) {
+        if (isFlagged(r)) invalid++;
+        else if (r.valid === true) valid++;
+        else if (r.valid === null) errors++;
+    }
     
     document.getElementById('stat-total').textContent = currentResults.length;
     document.getElementById('stat-valid').textContent = valid;
@@ -889,7 +1076,7 @@ function showResults() {
     }
     
     // Update filter button UI
-    document.querySelectorAll('.filter-btn').forEach(btn => {
+    filterBtns.forEach(btn => {
         btn.classList.remove('active');
         if (btn.dataset.filter === currentFilter) {
             btn.classList.add('active');
@@ -903,9 +1090,9 @@ function renderResults() {
     let filtered = currentResults;
     
     if (currentFilter === 'valid') {
-        filtered = currentResults.filter(r => r.valid === true);
+        filtered = currentResults.filter(r => r.valid === true && !isTitleMismatch(r));
     } else if (currentFilter === 'invalid') {
-        filtered = currentResults.filter(r => r.valid === false);
+        filtered = currentResults.filter(isFlagged);
     } else if (currentFilter === 'error') {
         filtered = currentResults.filter(r => r.valid === null);
     }
@@ -913,19 +1100,39 @@ function renderResults() {
     citationsList.innerHTML = filtered.map(r => renderCitation(r)).join('');
 }
 
+// The DOI exists, but its title doesn't look like the citation's
+function isTitleMismatch(result) {
+    return result.valid === true && result.similarity < TITLE_MATCH_THRESHOLD;
+}
+
+// Results that need attention: not found, or a DOI with someone else's title
+function isFlagged(result) {
+    return result.valid === false || isTitleMismatch(result);
+}
+
 function renderCitation(result) {
-    const statusClass = result.valid === true ? 'valid' : 
+    const titleMismatch = isTitleMismatch(result);
+    
+    const statusClass = titleMismatch ? 'valid mismatch' :
+                       result.valid === true ? 'valid' : 
                        result.valid === false ? 'invalid' : 'error';
-    const statusIcon = result.valid === true ? '✓' : 
+    const statusIcon = titleMismatch ? '⚠' :
+                      result.valid === true ? '✓' : 
                       result.valid === false ? '✗' : '?';
-    const statusText = result.valid === true ? 'Verified' : 
+    const statusText = titleMismatch ? 'Title Mismatch' :
+                      result.valid === true ? 'Verified' : 
                       result.valid === false ? 'Not Found' : 'Error';
     
     let details = '';
     if (result.valid === true) {
-        const methodBadge = result.method === 'doi' 
-            ? '<span class="method-badge doi">DOI ✓</span>' 
-            : `<span class="method-badge title">${result.similarity}% match</span>`;
+        let methodBadge = '';
+        if (titleMismatch) {
+            methodBadge = `<span class="method-badge mismatch">${result.similarity}% title match</span>`;
+        } else if (result.similarity !== undefined) {
+            methodBadge = `<span class="method-badge title">${result.similarity}% match</span>`;
+        } else if (result.method === 'crossref' || result.method === 'doi.org') {
+            methodBadge = '<span class="method-badge doi">DOI ✓</span>';
+        }
         details = `
             <div class="citation-details">
                 <div class="citation-title">${escapeHtml(result.title)}</div>
@@ -979,6 +1186,22 @@ function sleep(ms) {
     return new Promise(resolve => setTimeout(resolve, ms));
 }
 
+// Run fn over items with at most `limit` calls in flight; results keep input order
+async function mapConcurrent(items, limit, fn) {
+    const results = new Array(items.length);
+    let next = 0;
+    
+    async function worker() {
+        while (next < items.length) {
+            const i = next++;
+            results[i] = await fn(items[i], i);
+        }
+    }
+    
+    await Promise.all(Array.from({ length: Math.min(limit, items.length) }, worker));
+    return results;
+}
+
 function escapeHtml(text) {
     if (!text) return '';
     const div = document.createElement('div');